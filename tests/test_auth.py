@@ -0,0 +1,80 @@
+"""Tests for auth module."""
+
+import json
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+from tradestation.auth import AuthenticationError, TradeStationAuth
+
+
+class RecordingAdapter(BaseAdapter):
+    """Transport adapter that records prepared requests and answers with a canned body."""
+
+    def __init__(self, status_code=200, body=None):
+        super().__init__()
+        self.status_code = status_code
+        self.body = body if body is not None else {"access_token": "new", "expires_in": 1200}
+        self.requests = []
+
+    def send(self, request, **_kwargs):
+        self.requests.append(request)
+        response = requests.Response()
+        response.status_code = self.status_code
+        response._content = json.dumps(self.body).encode()
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def make_session(adapter):
+    session = requests.Session()
+    session.headers["Authorization"] = "Bearer stale"
+    session.mount("https://", adapter)
+    return session
+
+
+class TestTradeStationAuth:
+    """Tests for TradeStationAuth token refresh."""
+
+    def test_refresh_uses_injected_session(self):
+        adapter = RecordingAdapter()
+        auth = TradeStationAuth("id", "secret", "refresh", session=make_session(adapter))
+
+        assert auth.get_access_token() == "new"
+        assert len(adapter.requests) == 1
+        assert adapter.requests[0].url == TradeStationAuth.TOKEN_URL
+
+    def test_refresh_strips_session_authorization(self):
+        adapter = RecordingAdapter()
+        session = make_session(adapter)
+        auth = TradeStationAuth("id", "secret", "refresh", session=session)
+
+        auth.get_access_token()
+
+        assert "Authorization" not in adapter.requests[0].headers
+        # The API bearer header stays on the session for data requests
+        assert session.headers["Authorization"] == "Bearer stale"
+
+    def test_token_cached_until_invalidated(self):
+        adapter = RecordingAdapter()
+        auth = TradeStationAuth("id", "secret", "refresh", session=make_session(adapter))
+
+        auth.get_access_token()
+        auth.get_access_token()
+        assert len(adapter.requests) == 1
+
+        auth.invalidate()
+        auth.get_access_token()
+        assert len(adapter.requests) == 2
+
+    def test_refresh_failure(self):
+        adapter = RecordingAdapter(status_code=400, body={"error": "invalid_grant"})
+        auth = TradeStationAuth("id", "secret", "refresh", session=make_session(adapter))
+
+        with pytest.raises(AuthenticationError, match="Token refresh failed"):
+            auth.get_access_token()
@@ -0,0 +1,96 @@
+"""Tests for auth_setup module."""
+
+import socket
+import struct
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from tradestation.auth_setup import _wait_for_callback
+
+
+def send_request(port, path):
+    """Send a GET request to the callback server and return the raw response."""
+    with socket.create_connection(("localhost", port), timeout=5) as conn:
+        conn.sendall(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+        chunks = []
+        while chunk := conn.recv(4096):
+            chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def send_reset(port, path=None):
+    """Connect, optionally send a request, and abort the connection with a TCP reset."""
+    conn = socket.create_connection(("localhost", port), timeout=5)
+    if path is not None:
+        conn.sendall(f"GET {path} HTTP/1.1\r\n\r\n".encode())
+    conn.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+    conn.close()
+
+
+@pytest.fixture
+def callback_server():
+    """Run _wait_for_callback on an ephemeral port; yields (port, future)."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("localhost", 0))
+        sock.listen(1)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(_wait_for_callback, sock, 10)
+            yield sock.getsockname()[1], future
+            if not future.done():
+                send_request(sock.getsockname()[1], "/?error=test_teardown")
+
+
+class TestWaitForCallback:
+    """Tests for the OAuth callback socket loop."""
+
+    def test_returns_code(self, callback_server):
+        port, future = callback_server
+
+        response = send_request(port, "/?code=abc123&state=x")
+
+        assert response.startswith(b"HTTP/1.1 200 OK")
+        assert b"Authorization Successful" in response
+        assert future.result(timeout=5) == "abc123"
+
+    def test_other_path_gets_404_and_keeps_waiting(self, callback_server):
+        port, future = callback_server
+
+        response = send_request(port, "/favicon.ico")
+
+        assert response.startswith(b"HTTP/1.1 404 Not Found")
+        assert not future.done()
+        send_request(port, "/?code=abc123")
+        assert future.result(timeout=5) == "abc123"
+
+    def test_error_parameter(self, callback_server):
+        port, future = callback_server
+
+        response = send_request(port, "/?error=access_denied")
+
+        assert response.startswith(b"HTTP/1.1 400 Bad Request")
+        assert b"access_denied" in response
+        assert future.result(timeout=5) is None
+
+    def test_reset_connection_keeps_waiting(self, callback_server):
+        port, future = callback_server
+
+        send_reset(port)
+        send_request(port, "/?code=abc123")
+
+        assert future.result(timeout=5) == "abc123"
+
+    def test_reset_after_request_keeps_waiting(self, callback_server):
+        port, future = callback_server
+
+        send_reset(port, "/favicon.ico")
+        send_request(port, "/?code=abc123")
+
+        assert future.result(timeout=5) == "abc123"
+
+    def test_timeout(self):
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind(("localhost", 0))
+            sock.listen(1)
+
+            assert _wait_for_callback(sock, 0.1) is None
@@ -0,0 +1,75 @@
+"""Tests for config module."""
+
+import pytest
+
+from tradestation.config import ConfigurationError, _parse_config
+from tradestation.models import Compression
+from tradestation.storage import create_storage
+
+
+def make_config_data(**kwargs):
+    """Build a minimal config dictionary."""
+    data = {
+        "tradestation": {
+            "client_id": "id",
+            "client_secret": "secret",
+            "refresh_token": "token",
+        },
+    }
+    data.update(kwargs)
+    return data
+
+
+def storage_for(config, data_dir):
+    return create_storage(
+        config.storage_format,
+        data_dir,
+        compression=config.compression.value,
+        compression_level=config.compression_level,
+    )
+
+
+class TestParseConfigCompression:
+    """Tests for compression settings in _parse_config."""
+
+    def test_unset_level_stays_none(self):
+        config = _parse_config(make_config_data(compression="zstd"))
+        assert config.compression_level is None
+
+    def test_zstd_default_applied_by_storage(self, temp_data_dir):
+        config = _parse_config(make_config_data(compression="zstd"))
+        assert storage_for(config, temp_data_dir).compression_level == 3
+
+    def test_cli_override_uses_codec_default(self, temp_data_dir):
+        config = _parse_config(make_config_data(compression="zstd"))
+        config.compression = Compression.GZIP  # As run_download applies --compression
+        assert config.compression_level is None
+        assert storage_for(config, temp_data_dir).compression_level is None
+
+    def test_explicit_level_kept(self):
+        config = _parse_config(make_config_data(compression="gzip", compression_level=6))
+        assert config.compression_level == 6
+
+    def test_invalid_level(self):
+        with pytest.raises(ConfigurationError, match="Invalid compression level"):
+            _parse_config(make_config_data(compression="zstd", compression_level=99))
+
+
+class TestParseConfigWorkers:
+    """Tests for thread count settings in _parse_config."""
+
+    def test_defaults(self):
+        config = _parse_config(make_config_data())
+        assert config.page_workers == 1
+        assert config.write_workers == 2
+
+    def test_explicit_values(self):
+        config = _parse_config(make_config_data(page_workers=4, write_workers=8))
+        assert config.page_workers == 4
+        assert config.write_workers == 8
+
+    @pytest.mark.parametrize("key", ["page_workers", "write_workers"])
+    @pytest.mark.parametrize("value", [0, -1, 2.5, "4", True])
+    def test_invalid_values(self, key, value):
+        with pytest.raises(ConfigurationError, match=f"Invalid {key}"):
+            _parse_config(make_config_data(**{key: value}))
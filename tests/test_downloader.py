@@ -0,0 +1,347 @@
+"""Tests for downloader module."""
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+import pytest
+import requests
+
+from tradestation.downloader import DownloadStats, TradeStationDownloader, _extend_columns
+from tradestation.models import DownloadConfig, Precision
+
+
+def make_columns(rows):
+    """Column-wise API fields from (timestamp, close, volume) rows."""
+    return {
+        "TimeStamp": [ts for ts, _, _ in rows],
+        "Open": [close for _, close, _ in rows],
+        "High": [close for _, close, _ in rows],
+        "Low": [close for _, close, _ in rows],
+        "Close": [close for _, close, _ in rows],
+        "TotalVolume": [volume for _, _, volume in rows],
+    }
+
+
+def make_bar(ts, close="1", volume="1"):
+    """One API bar as returned by the barcharts endpoint."""
+    return {
+        "TimeStamp": ts,
+        "Open": close,
+        "High": close,
+        "Low": close,
+        "Close": close,
+        "TotalVolume": volume,
+        "DownTicks": 0,
+        "UpTicks": 0,
+    }
+
+
+class TestExtendColumns:
+    """Tests for _extend_columns."""
+
+    def test_transposes_pages(self):
+        columns = make_columns([])
+
+        _extend_columns(columns, [make_bar("2024-01-02T14:31:00Z", "2")])
+        _extend_columns(columns, [make_bar("2024-01-02T14:30:00Z", "1", "9")])
+
+        assert columns["TimeStamp"] == ["2024-01-02T14:31:00Z", "2024-01-02T14:30:00Z"]
+        assert columns["Close"] == ["2", "1"]
+        assert columns["TotalVolume"] == ["1", "9"]
+        assert "DownTicks" not in columns
+
+    def test_missing_field_becomes_none(self):
+        columns = make_columns([])
+        partial = make_bar("2024-01-02T14:31:00Z")
+        del partial["TotalVolume"]
+
+        _extend_columns(columns, [make_bar("2024-01-02T14:30:00Z"), partial])
+
+        assert columns["TotalVolume"] == ["1", None]
+        assert columns["TimeStamp"] == ["2024-01-02T14:30:00Z", "2024-01-02T14:31:00Z"]
+
+
+def make_downloader(data_dir, **kwargs):
+    """Downloader with dummy credentials (no request is made until a download starts)."""
+    config = DownloadConfig(
+        client_id="id",
+        client_secret="secret",
+        refresh_token="token",
+        data_dir=str(data_dir),
+        rate_limit_delay=0,
+        **kwargs,
+    )
+    return TradeStationDownloader(config)
+
+
+class TestDownloadStats:
+    """Tests for aggregating per-symbol DownloadStats."""
+
+    def test_merge(self):
+        total = DownloadStats(
+            symbols_processed=1, bars_downloaded=10, errors=1, failed_symbols=["@NQ"]
+        )
+        total.merge(DownloadStats(symbols_processed=2, symbols_skipped=1, bars_downloaded=5))
+        total.merge(DownloadStats(errors=1, failed_symbols=["@CL"]))
+
+        assert total.symbols_processed == 3
+        assert total.symbols_skipped == 1
+        assert total.bars_downloaded == 15
+        assert total.errors == 2
+        assert total.failed_symbols == ["@NQ", "@CL"]
+
+    def test_download_symbol_safe_records_failure(self, temp_data_dir):
+        downloader = make_downloader(temp_data_dir)
+
+        def fail(_symbol, _incremental):
+            raise RuntimeError("boom")
+
+        downloader._download_symbol = fail
+
+        stats = downloader._download_symbol_safe("@ES", incremental=True)
+
+        assert stats.errors == 1
+        assert stats.failed_symbols == ["@ES"]
+        assert stats.symbols_processed == 0
+        assert downloader.stats.errors == 0  # Shared stats are only merged by the caller
+
+
+class TestFetchBarsConcurrent:
+    """Tests for fetching fixed date windows concurrently."""
+
+    @staticmethod
+    def fake_api(listed, fail_before=None):
+        """Fake _api_request serving one bar per minute from listed onwards."""
+
+        def api_request(_symbol, last_date, first_date=None):
+            if fail_before is not None and first_date < fail_before:
+                return None
+            minutes = pd.date_range(
+                max(pd.Timestamp(first_date).ceil("min"), listed), last_date, freq="min"
+            )
+            return {"Bars": [make_bar(m.strftime("%Y-%m-%dT%H:%M:%SZ")) for m in minutes]}
+
+        return api_request
+
+    def test_skips_empty_windows_and_boundary_duplicates(self, temp_data_dir):
+        downloader = make_downloader(temp_data_dir, page_workers=4, max_bars_per_request=3)
+        now = pd.Timestamp(datetime.now(timezone.utc).replace(tzinfo=None)).floor("min")
+        start = (now - timedelta(minutes=12)).to_pydatetime()
+        listed = now - timedelta(minutes=5)  # Earlier windows return {"Bars": []}
+        downloader._api_request = self.fake_api(listed)
+
+        df = downloader._fetch_bars("@MET", start)
+
+        assert df["datetime"].iloc[0] == listed
+        assert df["datetime"].is_unique
+        assert (df["datetime"].diff().dropna() == pd.Timedelta(minutes=1)).all()
+        assert df["datetime"].iloc[-1] < pd.Timestamp(
+            datetime.now(timezone.utc).replace(tzinfo=None)
+        )
+
+    def test_failed_window_raises(self, temp_data_dir):
+        downloader = make_downloader(temp_data_dir, page_workers=4, max_bars_per_request=3)
+        start = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(minutes=12)
+        downloader._api_request = self.fake_api(
+            pd.Timestamp(start), fail_before=start + timedelta(minutes=3)
+        )
+
+        with pytest.raises(RuntimeError, match="Failed to fetch bars"):
+            downloader._fetch_bars("@ES", start)
+
+
+class TestFetchBars:
+    """Tests for the sequential pagination in _fetch_bars."""
+
+    def test_failed_request_raises(self, temp_data_dir):
+        downloader = make_downloader(temp_data_dir)
+        downloader._api_request = lambda *_args, **_kwargs: None
+
+        with pytest.raises(RuntimeError, match="Failed to fetch bars"):
+            downloader._fetch_bars("@ES", datetime(2024, 1, 1))
+
+    def test_empty_page_ends_history(self, temp_data_dir):
+        downloader = make_downloader(temp_data_dir)
+        downloader._api_request = lambda *_args, **_kwargs: {"Bars": []}
+
+        assert downloader._fetch_bars("@ES", datetime(2024, 1, 1)).empty
+
+
+def make_response(status_code, content=b"", headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response._content = content
+    response.url = "https://api.tradestation.com/v3/marketdata/barcharts/@ES"
+    return response
+
+
+class FakeAuth:
+    """Auth stand-in that hands out a new token after each invalidate()."""
+
+    def __init__(self):
+        self.invalidations = 0
+
+    def get_access_token(self):
+        return f"token-{self.invalidations}"
+
+    def invalidate(self):
+        self.invalidations += 1
+
+
+class TestApiRequest:
+    """Tests for the retry loop in _api_request."""
+
+    @staticmethod
+    def setup_downloader(data_dir, responses):
+        downloader = make_downloader(data_dir)
+        downloader._auth = FakeAuth()
+        sent = []
+
+        def get(_url, **_kwargs):
+            sent.append(downloader._session.headers["Authorization"])
+            return responses.pop(0)
+
+        downloader._session.get = get
+        return downloader, sent
+
+    def test_refreshes_token_on_401(self, temp_data_dir):
+        downloader, sent = self.setup_downloader(
+            temp_data_dir, [make_response(401), make_response(200, b'{"Bars": []}')]
+        )
+
+        assert downloader._api_request("@ES", datetime(2024, 1, 2)) == {"Bars": []}
+        assert downloader._auth.invalidations == 1
+        assert sent == ["Bearer token-0", "Bearer token-1"]
+
+    def test_waits_out_rate_limits(self, temp_data_dir, monkeypatch):
+        waits = []
+        monkeypatch.setattr("tradestation.downloader.time.sleep", waits.append)
+        rate_limited = [make_response(429, headers={"Retry-After": "2"}) for _ in range(4)]
+        downloader, sent = self.setup_downloader(
+            temp_data_dir, [*rate_limited, make_response(200, b'{"Bars": []}')]
+        )
+
+        # More 429s than max_retries still end in the data, not a failure
+        assert downloader._api_request("@ES", datetime(2024, 1, 2)) == {"Bars": []}
+        assert len(sent) == 5
+        assert waits == [2, 2, 2, 2]
+
+    def test_rate_limit_without_retry_after(self, temp_data_dir, monkeypatch):
+        waits = []
+        monkeypatch.setattr("tradestation.downloader.time.sleep", waits.append)
+        downloader, _ = self.setup_downloader(
+            temp_data_dir, [make_response(429), make_response(200, b'{"Bars": []}')]
+        )
+
+        assert downloader._api_request("@ES", datetime(2024, 1, 2)) == {"Bars": []}
+        assert waits == [60]
+
+    def test_retries_invalid_json(self, temp_data_dir, monkeypatch):
+        monkeypatch.setattr("tradestation.downloader.time.sleep", lambda _seconds: None)
+        downloader, sent = self.setup_downloader(
+            temp_data_dir, [make_response(200, b"<html>"), make_response(200, b'{"Bars": []}')]
+        )
+
+        assert downloader._api_request("@ES", datetime(2024, 1, 2)) == {"Bars": []}
+        assert len(sent) == 2
+
+    def test_invalid_json_gives_up(self, temp_data_dir, monkeypatch):
+        monkeypatch.setattr("tradestation.downloader.time.sleep", lambda _seconds: None)
+        downloader, sent = self.setup_downloader(
+            temp_data_dir, [make_response(200, b"<html>") for _ in range(4)]
+        )
+
+        assert downloader._api_request("@ES", datetime(2024, 1, 2)) is None
+        assert len(sent) == 4  # First attempt plus max_retries
+
+    def test_http_error_returns_none(self, temp_data_dir):
+        downloader, sent = self.setup_downloader(temp_data_dir, [make_response(503)])
+
+        assert downloader._api_request("@ES", datetime(2024, 1, 2)) is None
+        assert len(sent) == 1
+
+
+class TestBarsToDataFrame:
+    """Tests for TradeStationDownloader._bars_to_dataframe."""
+
+    def test_empty(self):
+        df = TradeStationDownloader._bars_to_dataframe(make_columns([]), datetime(2024, 1, 1))
+
+        assert df.empty
+        assert list(df.columns) == ["datetime", "open", "high", "low", "close", "volume"]
+
+    def test_parses_strings_and_sorts(self):
+        columns = make_columns(
+            [
+                ("2024-01-02T14:31:00Z", "101.25", "7"),
+                ("2024-01-02T14:30:00Z", "100.5", "5"),
+            ]
+        )
+
+        df = TradeStationDownloader._bars_to_dataframe(columns, datetime(2024, 1, 1))
+
+        assert list(df["datetime"]) == list(
+            pd.to_datetime(["2024-01-02 14:30", "2024-01-02 14:31"])
+        )
+        assert list(df["close"]) == [100.5, 101.25]
+        assert list(df["volume"]) == [5, 7]
+        assert df["close"].dtype == np.float64
+
+    def test_keeps_start_date_to_cutoff(self):
+        columns = make_columns(
+            [
+                ("2024-01-02T14:29:00Z", "1", "1"),
+                ("2024-01-02T14:30:00Z", "2", "1"),
+                ("2024-01-02T14:31:00Z", "3", "1"),
+                ("2024-01-02T14:32:00Z", "4", "1"),
+            ]
+        )
+
+        df = TradeStationDownloader._bars_to_dataframe(
+            columns, datetime(2024, 1, 2, 14, 30), cutoff=datetime(2024, 1, 2, 14, 32)
+        )
+
+        # start_date is inclusive, cutoff (a possibly still-forming bar) is exclusive
+        assert list(df["close"]) == [2.0, 3.0]
+        assert list(df.index) == [0, 1]
+
+    def test_keeps_last_duplicate(self):
+        columns = make_columns(
+            [
+                ("2024-01-02T14:31:00Z", "1", "1"),
+                ("2024-01-02T14:30:00Z", "2", "1"),
+                ("2024-01-02T14:31:00Z", "3", "1"),
+            ]
+        )
+
+        df = TradeStationDownloader._bars_to_dataframe(columns, datetime(2024, 1, 1))
+
+        assert list(df["close"]) == [2.0, 3.0]
+
+    def test_unparseable_values_become_nan(self):
+        columns = make_columns([("2024-01-02T14:30:00Z", None, "bad")])
+
+        df = TradeStationDownloader._bars_to_dataframe(columns, datetime(2024, 1, 1))
+
+        assert df["close"].isna().all()
+        assert df["volume"].isna().all()
+
+    def test_float32_precision(self):
+        columns = make_columns(
+            [
+                ("2024-01-02T14:30:00Z", "100.25", "5"),
+                ("2024-01-02T14:31:00Z", "100.5", None),
+            ]
+        )
+
+        df = TradeStationDownloader._bars_to_dataframe(
+            columns, datetime(2024, 1, 1), precision=Precision.FLOAT32
+        )
+
+        assert (df[["open", "high", "low", "close"]].dtypes == np.float32).all()
+        assert df["volume"].dtype == np.uint32
+        # A missing volume cannot be NaN in an unsigned column
+        assert list(df["volume"]) == [5, 0]
+        assert list(df["close"]) == [100.25, 100.5]
@@ -1,13 +1,18 @@
 """Tests for models module."""
 
+import pyarrow as pa
 import pytest
 
 from tradestation.models import (
+    Compression,
     DownloadConfig,
+    Precision,
     StorageFormat,
     get_all_symbols,
     get_symbols_by_category,
+    resolve_compression_level,
     DEFAULT_SYMBOLS,
+    _COMPRESSION_LEVELS,
 )
 
 
@@ -42,6 +47,29 @@ class TestDownloadConfig:
         assert config.storage_format == StorageFormat.SINGLE
         assert config.interval == 1
         assert config.unit == "Minute"
+        assert config.compression_level is None
+
+    def test_positional_baseline_fields(self):
+        config = DownloadConfig(
+            "id",
+            "secret",
+            "token",
+            "./out",
+            "2020-01-01",
+            ["@ES"],
+            5,
+            "Minute",
+            1000,
+            0.5,
+            2,
+            1,
+            "daily",
+            "gzip",
+            False,
+        )
+        assert config.storage_format == StorageFormat.DAILY
+        assert config.compression == Compression.GZIP
+        assert config.datetime_index is False
 
     def test_storage_format_string_conversion(self):
         config = DownloadConfig(
@@ -52,6 +80,41 @@ class TestDownloadConfig:
         )
         assert config.storage_format == StorageFormat.MONTHLY
 
+    def test_precision_string_conversion(self):
+        config = DownloadConfig(
+            client_id="id",
+            client_secret="secret",
+            refresh_token="token",
+            precision="FLOAT32",
+        )
+        assert config.precision == Precision.FLOAT32
+
+
+class TestResolveCompressionLevel:
+    """Tests for resolve_compression_level."""
+
+    def test_defaults(self):
+        assert resolve_compression_level("zstd", None) == 3
+        assert resolve_compression_level("gzip", None) is None
+        assert resolve_compression_level("none", None) is None
+
+    def test_explicit_level(self):
+        assert resolve_compression_level("zstd", 9) == 9
+        assert resolve_compression_level("gzip", 6) == 6
+        # Codecs without levels ignore the setting
+        assert resolve_compression_level("snappy", 9) is None
+
+    def test_ranges_supported_by_pyarrow(self):
+        for codec, (low, high) in _COMPRESSION_LEVELS.items():
+            assert pa.Codec.minimum_compression_level(codec) <= low
+            assert high <= pa.Codec.maximum_compression_level(codec)
+
+    def test_invalid_level(self):
+        with pytest.raises(ValueError, match="Invalid compression level"):
+            resolve_compression_level("zstd", 99)
+        with pytest.raises(ValueError, match="Invalid compression level"):
+            resolve_compression_level("gzip", "high")
+
 
 class TestSymbols:
     """Tests for symbol utilities."""
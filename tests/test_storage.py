@@ -1,5 +1,9 @@
 """Tests for storage module."""
 
+import os
+from datetime import datetime
+from pathlib import Path
+
 import pandas as pd
 
 from tradestation.models import StorageFormat
@@ -54,6 +58,14 @@ class TestSingleFileStorage:
         symbols = storage.list_symbols()
         assert set(symbols) == {"ES", "NQ"}
 
+    def test_list_symbols_skips_hidden_files_and_dirs(self, temp_data_dir):
+        storage = SingleFileStorage(temp_data_dir)
+        storage.save("ES", create_sample_df(["2024-01-01 09:30"]))
+        (temp_data_dir / "._@ES_1min.parquet").write_bytes(b"")
+        (temp_data_dir / "NQ_1min.parquet").mkdir()
+
+        assert storage.list_symbols() == ["ES"]
+
     def test_get_file_size(self, temp_data_dir):
         storage = SingleFileStorage(temp_data_dir)
         df = create_sample_df(["2024-01-01 09:30"])
@@ -63,6 +75,59 @@ class TestSingleFileStorage:
 
         assert size > 0
 
+    def test_get_last_timestamp(self, temp_data_dir):
+        storage = SingleFileStorage(temp_data_dir)
+        df = create_sample_df(["2024-01-01 09:30", "2024-01-01 09:31"])
+
+        storage.save("ES", df)
+
+        assert storage.get_last_timestamp("ES") == pd.Timestamp("2024-01-01 09:31")
+        assert storage.get_last_timestamp("NONEXISTENT") is None
+
+    def test_load_date_range(self, temp_data_dir):
+        storage = SingleFileStorage(temp_data_dir)
+        df = create_sample_df(["2024-01-01 09:30", "2024-01-02 09:30", "2024-01-03 09:30"])
+
+        storage.save("ES", df)
+        loaded = storage.load("ES", start=datetime(2024, 1, 2), end=datetime(2024, 1, 2, 23, 59))
+
+        assert list(loaded.index) == [pd.Timestamp("2024-01-02 09:30")]
+
+    def test_save_sorts_and_keeps_last_duplicate(self, temp_data_dir):
+        storage = SingleFileStorage(temp_data_dir)
+        df = create_sample_df(["2024-01-01 09:31", "2024-01-01 09:30", "2024-01-01 09:31"])
+        df["close"] = [1.0, 2.0, 3.0]
+
+        storage.save("ES", df)
+        loaded = storage.load("ES")
+
+        assert list(loaded.index) == list(pd.to_datetime(["2024-01-01 09:30", "2024-01-01 09:31"]))
+        assert list(loaded["close"]) == [2.0, 3.0]
+
+    def test_save_keeps_last_of_sorted_duplicates(self, temp_data_dir):
+        storage = SingleFileStorage(temp_data_dir)
+        df = create_sample_df(["2024-01-01 09:30", "2024-01-01 09:30", "2024-01-01 09:31"])
+        df["close"] = [1.0, 2.0, 3.0]
+
+        storage.save("ES", df)
+        loaded = storage.load("ES")
+
+        assert list(loaded["close"]) == [2.0, 3.0]
+
+    def test_append_merges_overlap(self, temp_data_dir):
+        storage = SingleFileStorage(temp_data_dir)
+        storage.save("ES", create_sample_df(["2024-01-01 09:30", "2024-01-01 09:31"]))
+
+        new_df = create_sample_df(["2024-01-01 09:31", "2024-01-01 09:32"])
+        new_df["close"] = 200.0
+        storage.append("ES", new_df)
+        loaded = storage.load("ES")
+
+        assert list(loaded.index) == list(pd.to_datetime(
+            ["2024-01-01 09:30", "2024-01-01 09:31", "2024-01-01 09:32"]
+        ))
+        assert list(loaded["close"]) == [100.5, 200.0, 200.0]
+
 
 class TestDailyPartitionedStorage:
     """Tests for DailyPartitionedStorage."""
@@ -94,6 +159,39 @@ class TestDailyPartitionedStorage:
         assert (temp_data_dir / "ES_index_1" / "year=2024" / "month=01" / "day=15").exists()
         assert (temp_data_dir / "ES_index_1" / "year=2024" / "month=01" / "day=16").exists()
 
+    def test_load_date_range(self, temp_data_dir):
+        storage = DailyPartitionedStorage(temp_data_dir, datetime_index=False)
+        df = create_sample_df([
+            "2024-01-31 09:30",
+            "2024-02-01 09:30",
+            "2024-02-01 10:30",
+            "2024-02-02 09:30",
+        ])
+
+        storage.save("ES", df)
+        loaded = storage.load("ES", start=datetime(2024, 2, 1, 10))
+
+        assert list(loaded["datetime"]) == list(pd.to_datetime(["2024-02-01 10:30", "2024-02-02 09:30"]))
+
+    def test_get_last_timestamp(self, temp_data_dir):
+        storage = DailyPartitionedStorage(temp_data_dir)
+        df = create_sample_df([
+            "2024-01-15 09:30",
+            "2024-01-16 09:30",
+            "2024-01-16 15:59",
+        ])
+
+        storage.save("ES", df)
+
+        assert storage.get_last_timestamp("ES") == pd.Timestamp("2024-01-16 15:59")
+
+    def test_get_last_timestamp_skips_empty_partition(self, temp_data_dir):
+        storage = DailyPartitionedStorage(temp_data_dir)
+        storage.save("ES", create_sample_df(["2024-01-15 09:30"]))
+        (temp_data_dir / "ES_index_1" / "year=2024" / "month=02" / "day=01").mkdir(parents=True)
+
+        assert storage.get_last_timestamp("ES") == pd.Timestamp("2024-01-15 09:30")
+
 
 class TestMonthlyPartitionedStorage:
     """Tests for MonthlyPartitionedStorage."""
@@ -124,6 +222,52 @@ class TestMonthlyPartitionedStorage:
         assert (temp_data_dir / "ES_index_1" / "year_month=2024-01").exists()
         assert (temp_data_dir / "ES_index_1" / "year_month=2024-02").exists()
 
+    def test_load_date_range(self, temp_data_dir):
+        storage = MonthlyPartitionedStorage(temp_data_dir)
+        df = create_sample_df([
+            "2024-01-15 09:30",
+            "2024-02-15 09:30",
+            "2024-03-15 09:30",
+        ])
+
+        storage.save("ES", df)
+        loaded = storage.load("ES", start=datetime(2024, 2, 1), end=datetime(2024, 2, 29))
+
+        assert list(loaded.index) == [pd.Timestamp("2024-02-15 09:30")]
+
+    def test_list_symbols(self, temp_data_dir):
+        storage = MonthlyPartitionedStorage(temp_data_dir)
+        storage.save("ES", create_sample_df(["2024-01-15 09:30"]))
+        (temp_data_dir / "empty_index_1").mkdir()
+
+        assert storage.list_symbols() == ["ES"]
+
+    def test_list_symbols_skips_unreadable_folder(self, temp_data_dir, monkeypatch):
+        storage = MonthlyPartitionedStorage(temp_data_dir)
+        storage.save("ES", create_sample_df(["2024-01-15 09:30"]))
+        locked = temp_data_dir / "locked"
+        locked.mkdir()
+        scandir = os.scandir
+
+        def fake_scandir(path):
+            if Path(path) == locked:
+                raise PermissionError(13, "Permission denied", str(path))
+            return scandir(path)
+
+        monkeypatch.setattr("tradestation.storage.os.scandir", fake_scandir)
+
+        assert storage.list_symbols() == ["ES"]
+
+    def test_append_across_month_boundary(self, temp_data_dir):
+        storage = MonthlyPartitionedStorage(temp_data_dir)
+        storage.save("ES", create_sample_df(["2024-01-31 23:58", "2024-01-31 23:59"]))
+
+        storage.append("ES", create_sample_df(["2024-01-31 23:59", "2024-02-01 00:00"]))
+        loaded = storage.load("ES")
+
+        assert len(loaded) == 3
+        assert (temp_data_dir / "ES_index_1" / "year_month=2024-02").exists()
+
 
 class TestCreateStorage:
     """Tests for create_storage factory function."""
@@ -140,6 +284,11 @@ class TestCreateStorage:
         storage = create_storage(StorageFormat.MONTHLY, temp_data_dir)
         assert isinstance(storage, MonthlyPartitionedStorage)
 
+    def test_compression_level_defaults(self, temp_data_dir):
+        assert create_storage(StorageFormat.SINGLE, temp_data_dir).compression_level == 3
+        gzip = create_storage(StorageFormat.SINGLE, temp_data_dir, compression="gzip")
+        assert gzip.compression_level is None
+
 
 class TestDetectStorageFormat:
     """Tests for detect_storage_format function."""
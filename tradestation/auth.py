@@ -29,7 +29,13 @@ class TradeStationAuth:
     TOKEN_URL = "https://signin.tradestation.com/oauth/token"
     REFRESH_BUFFER_MINUTES = 5
 
-    def __init__(self, client_id: str, client_secret: str, refresh_token: str):
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        refresh_token: str,
+        session: requests.Session | None = None,
+    ):
         """
         Initialize the authentication handler.
 
@@ -37,7 +43,9 @@ class TradeStationAuth:
             client_id: TradeStation API client ID
             client_secret: TradeStation API client secret
             refresh_token: OAuth2 refresh token for obtaining access tokens
+            session: HTTP session to reuse for token requests (a new one if omitted)
         """
+        self._session = session or requests.Session()
         self._client_id = client_id
         self._client_secret = client_secret
         self._refresh_token = refresh_token
@@ -82,7 +90,10 @@ class TradeStationAuth:
         }
 
         try:
-            response = requests.post(self.TOKEN_URL, data=payload, timeout=30)
+            # A shared session may carry an API bearer header; never send it to the token endpoint
+            response = self._session.post(
+                self.TOKEN_URL, data=payload, headers={"Authorization": None}, timeout=30
+            )
             response.raise_for_status()
         except requests.exceptions.RequestException as e:
             raise AuthenticationError(f"Token refresh failed: {e}") from e
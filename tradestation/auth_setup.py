@@ -13,15 +13,18 @@ This script will:
 4. Save it to config.yaml
 """
 
+import contextlib
+import socket
 import sys
-import threading
+import time
 import webbrowser
-from http.server import BaseHTTPRequestHandler, HTTPServer
 from pathlib import Path
 from urllib.parse import parse_qs, urlencode, urlparse
 
 import requests
 import yaml
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # TradeStation OAuth endpoints
 AUTHORIZE_URL = "https://signin.tradestation.com/authorize"
@@ -32,44 +35,81 @@ CALLBACK_PORT = 3000
 REDIRECT_URI = f"http://localhost:{CALLBACK_PORT}"
 
 
-class CallbackHandler(BaseHTTPRequestHandler):
-    """Handle OAuth callback."""
+def _create_session() -> requests.Session:
+    """Create a pooled session that retries failed connection attempts.
 
-    auth_code = None
+    Only connection errors are retried: an authorization code is single-use, so a
+    token request that reached the server must never be sent twice.
+    """
+    session = requests.Session()
+    retry = Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.5)
+    session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=retry))
+    return session
 
-    def do_GET(self):
-        """Handle GET request from OAuth callback."""
-        parsed = urlparse(self.path)
 
-        if parsed.path == "/":
+_SESSION = _create_session()
+
+
+_SUCCESS_PAGE = b"""
+    <html>
+    <body style="font-family: sans-serif; text-align: center; padding: 50px;">
+        <h1>Authorization Successful!</h1>
+        <p>You can close this window and return to the terminal.</p>
+    </body>
+    </html>
+"""
+
+
+def _send_response(conn: socket.socket, status: str, body: bytes = b"") -> None:
+    """Write a minimal HTTP/1.1 response, ignoring clients that already hung up."""
+    header = (
+        f"HTTP/1.1 {status}\r\n"
+        "Content-Type: text/html\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        "Connection: close\r\n\r\n"
+    )
+    # The request was already read; a lost reply must not abort the wait
+    with contextlib.suppress(OSError):
+        conn.sendall(header.encode() + body)
+
+
+def _wait_for_callback(sock: socket.socket, timeout: float) -> str | None:
+    """Accept connections until the OAuth redirect arrives; return the code."""
+    deadline = time.monotonic() + timeout
+
+    while (remaining := deadline - time.monotonic()) > 0:
+        sock.settimeout(remaining)
+        try:
+            conn, _ = sock.accept()
+        except TimeoutError:
+            break
+
+        with conn:
+            conn.settimeout(10)
+            try:
+                request_line = conn.recv(4096).split(b"\r\n", 1)[0].decode("latin-1")
+            except OSError:
+                continue
+
+            # Request line: "GET /?code=... HTTP/1.1"
+            parts = request_line.split(" ")
+            parsed = urlparse(parts[1] if len(parts) >= 2 else "")
             query_params = parse_qs(parsed.query)
 
-            if "code" in query_params:
-                CallbackHandler.auth_code = query_params["code"][0]
-                self.send_response(200)
-                self.send_header("Content-type", "text/html")
-                self.end_headers()
-                self.wfile.write(b"""
-                    <html>
-                    <body style="font-family: sans-serif; text-align: center; padding: 50px;">
-                        <h1>Authorization Successful!</h1>
-                        <p>You can close this window and return to the terminal.</p>
-                    </body>
-                    </html>
-                """)
+            if parsed.path != "/":
+                # Browsers also ask for /favicon.ico and the like
+                _send_response(conn, "404 Not Found")
+            elif "code" in query_params:
+                _send_response(conn, "200 OK", _SUCCESS_PAGE)
+                return query_params["code"][0]
             else:
-                self.send_response(400)
-                self.send_header("Content-type", "text/html")
-                self.end_headers()
                 error = query_params.get("error", ["Unknown error"])[0]
-                self.wfile.write(f"<html><body>Error: {error}</body></html>".encode())
-        else:
-            self.send_response(404)
-            self.end_headers()
+                body = f"<html><body>Error: {error}</body></html>".encode()
+                _send_response(conn, "400 Bad Request", body)
+                if "error" in query_params:
+                    return None
 
-    def log_message(self, format, *args):
-        """Suppress logging."""
-        pass
+    return None
 
 
 def get_authorization_code(client_id: str) -> str:
@@ -92,20 +132,21 @@ def get_authorization_code(client_id: str) -> str:
     print("If browser doesn't open, visit this URL manually:")
     print(f"\n{auth_url}\n")
 
-    # Start local server to receive callback
-    server = HTTPServer(("localhost", CALLBACK_PORT), CallbackHandler)
-    server_thread = threading.Thread(target=server.handle_request)
-    server_thread.start()
+    # Listen for the callback before sending the user to the browser
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind(("localhost", CALLBACK_PORT))
+        sock.listen(1)
 
-    # Open browser
-    webbrowser.open(auth_url)
+        # Open browser
+        webbrowser.open(auth_url)
 
-    print("Waiting for authorization...")
-    server_thread.join(timeout=300)  # 5 minute timeout
+        print("Waiting for authorization...")
+        auth_code = _wait_for_callback(sock, timeout=300)  # 5 minute timeout
 
-    if CallbackHandler.auth_code:
+    if auth_code:
         print("Authorization code received!")
-        return CallbackHandler.auth_code
+        return auth_code
     else:
         raise TimeoutError("Authorization timed out. Please try again.")
 
@@ -125,7 +166,7 @@ def exchange_code_for_tokens(client_id: str, client_secret: str, auth_code: str)
         "redirect_uri": REDIRECT_URI,
     }
 
-    response = requests.post(TOKEN_URL, data=payload)
+    response = _SESSION.post(TOKEN_URL, data=payload, timeout=30)
 
     if response.status_code != 200:
         print(f"Error: {response.status_code}")
@@ -8,7 +8,7 @@ import sys
 
 from .config import ConfigurationError, load_config
 from .downloader import TradeStationDownloader
-from .models import DEFAULT_SYMBOLS, Compression, StorageFormat
+from .models import DEFAULT_SYMBOLS, Compression, Precision, StorageFormat
 
 # Configure logging
 logging.basicConfig(
@@ -65,6 +65,18 @@ Examples:
         metavar="ALGO",
         help="Parquet compression: zstd (default), snappy, gzip, lz4, or none",
     )
+    parser.add_argument(
+        "--compression-level",
+        type=int,
+        metavar="N",
+        help="Compression level; higher = smaller, slower (default: 3 for zstd, else codec default)",
+    )
+    parser.add_argument(
+        "--precision",
+        choices=["float64", "float32"],
+        metavar="TYPE",
+        help="Stored value precision: float64 (default, exact) or float32 (half size, ~7 digits)",
+    )
     parser.add_argument(
         "--no-datetime-index",
         action="store_true",
@@ -158,6 +170,12 @@ def run_download(args: argparse.Namespace) -> int:
     # Override compression if provided
     if args.compression:
         config.compression = Compression.from_string(args.compression)
+    if args.compression_level is not None:
+        config.compression_level = args.compression_level
+
+    # Override precision if provided
+    if args.precision:
+        config.precision = Precision.from_string(args.precision)
 
     # Override datetime_index if provided
     if args.no_datetime_index:
@@ -6,7 +6,14 @@ from pathlib import Path
 
 import yaml
 
-from .models import Compression, DownloadConfig, StorageFormat, get_all_symbols
+from .models import (
+    Compression,
+    DownloadConfig,
+    Precision,
+    StorageFormat,
+    get_all_symbols,
+    resolve_compression_level,
+)
 
 
 class ConfigurationError(Exception):
@@ -44,6 +51,14 @@ def load_config(config_path: str = "config.yaml") -> DownloadConfig:
     return _parse_config(data)
 
 
+def _parse_worker_count(data: dict, key: str, default: int) -> int:
+    """Read a thread count setting, which must be a positive integer."""
+    value = data.get(key, default)
+    if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+        raise ConfigurationError(f"Invalid {key}: {value!r}. Must be an integer >= 1")
+    return value
+
+
 def _parse_config(data: dict) -> DownloadConfig:
     """Parse configuration dictionary into DownloadConfig."""
     # Validate required fields
@@ -69,9 +84,20 @@ def _parse_config(data: dict) -> DownloadConfig:
         raise ConfigurationError(str(e)) from e
 
     # Parse compression
+    # The level is only validated here; the zstd default is applied by the storage
+    # backend once the final codec (after any CLI override) is known.
     compression_str = data.get("compression", "zstd")
+    compression_level = data.get("compression_level")
     try:
         compression = Compression.from_string(compression_str)
+        resolve_compression_level(compression.value, compression_level)
+    except ValueError as e:
+        raise ConfigurationError(str(e)) from e
+
+    # Parse precision
+    precision_str = data.get("precision", "float64")
+    try:
+        precision = Precision.from_string(precision_str)
     except ValueError as e:
         raise ConfigurationError(str(e)) from e
 
@@ -87,8 +113,12 @@ def _parse_config(data: dict) -> DownloadConfig:
         max_bars_per_request=data.get("max_bars_per_request", 57600),
         rate_limit_delay=data.get("rate_limit_delay", 0.2),
         max_retries=data.get("max_retries", 3),
+        page_workers=_parse_worker_count(data, "page_workers", 1),
+        write_workers=_parse_worker_count(data, "write_workers", 2),
         storage_format=storage_format,
         compression=compression,
+        compression_level=compression_level,
+        precision=precision,
     )
 
 
@@ -124,10 +154,26 @@ storage_format: "single"
 # "lz4"    - Fastest, lower compression
 # "none"   - No compression
 compression: "zstd"
+# compression_level: 3        # Higher = smaller files, slower writes
+#                             # (default: 3 for zstd, 1-22; codec default for gzip 1-9, lz4 1-12)
+
+# Numeric Precision
+# "float64" - Exact API values (recommended)
+# "float32" - OHLC as float32 (~7 significant digits), volume as uint32.
+#             About half the memory and noticeably smaller files, but prices
+#             with many digits (e.g. FX, large index levels) may be rounded.
+#             Use one setting consistently for a given data_dir.
+precision: "float64"
 
 # Rate Limiting (be careful not to exceed API limits)
 rate_limit_delay: 0.2        # Seconds between API requests
 max_retries: 3               # Retries on failed requests
+page_workers: 1              # Concurrent page requests per symbol, Minute bars (1 = sequential)
+
+# Disk Writes
+# Threads writing daily/monthly partition files, per symbol being downloaded.
+# Total writer threads can reach max_workers x write_workers; use 1 on slow HDDs.
+write_workers: 2
 
 # Symbols to Download
 # Comment out this section to use all default US futures
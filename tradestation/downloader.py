@@ -3,20 +3,27 @@ TradeStation market data downloader.
 """
 
 import logging
+import operator
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from threading import Lock
 from typing import Any
 
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # Optional speedup: pip install "tradestation-downloader[fast]"
+    from json import loads as _json_loads
 
 from .auth import TradeStationAuth
-from .models import DownloadConfig
-from .storage import create_storage
+from .models import DownloadConfig, Precision
+from .storage import create_storage, last_unique
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +37,41 @@ _COLUMN_MAP = {
     "TotalVolume": "volume",
 }
 _OUTPUT_COLUMNS = ["datetime", "open", "high", "low", "close", "volume"]
+_PRICE_COLUMNS = ["open", "high", "low", "close"]
+_get_bar_fields = operator.itemgetter(*_COLUMN_MAP)
+
+
+def _extend_columns(columns: dict[str, list], bars: list[dict]) -> None:
+    """Append one page of API bars to the column-wise field lists."""
+    if not bars:  # e.g. a date window before the contract was listed
+        return
+    # Transpose rows to columns in C (itemgetter + zip) rather than one pass per field
+    try:
+        fields = zip(*map(_get_bar_fields, bars), strict=True)
+    except KeyError:  # Some bar lacks a field; it becomes NaN
+        fields = ([bar.get(key) for bar in bars] for key in columns)
+    for values, column in zip(columns.values(), fields, strict=True):
+        values.extend(column)
+
+
+def _sleep_remaining(started: float, delay: float) -> None:
+    """Sleep until delay seconds have passed since started (a time.monotonic() value)."""
+    remaining = delay - (time.monotonic() - started)
+    if remaining > 0:
+        time.sleep(remaining)
+
+
+def _retry_after(resp: requests.Response, default: int = 60) -> int:
+    """Seconds to wait from a 429 response's Retry-After header (default when absent)."""
+    try:
+        return max(0, int(resp.headers.get("Retry-After", default)))
+    except ValueError:  # An HTTP-date rather than seconds
+        return default
+
+
+def _parse_timestamps(values: list[str]) -> pd.DatetimeIndex:
+    """Parse API ISO 8601 timestamps (e.g. 2024-01-02T14:30:00Z) to naive UTC."""
+    return pd.to_datetime(values, format="ISO8601", utc=True).tz_localize(None)
 
 
 @dataclass
@@ -50,6 +92,14 @@ class DownloadStats:
             return timedelta(0)
         return (self.end_time or datetime.now()) - self.start_time
 
+    def merge(self, other: "DownloadStats") -> None:
+        """Add another session's counters (e.g. one symbol's) to this one."""
+        self.symbols_processed += other.symbols_processed
+        self.symbols_skipped += other.symbols_skipped
+        self.bars_downloaded += other.bars_downloaded
+        self.errors += other.errors
+        self.failed_symbols.extend(other.failed_symbols)
+
 
 class TradeStationDownloader:
     """
@@ -66,24 +116,48 @@ class TradeStationDownloader:
 
     def __init__(self, config: DownloadConfig):
         self.config = config
+        # Keep-alive connection pool shared by all worker threads and token refreshes.
+        # Transient server errors are retried by urllib3; rate limits are waited out in
+        # _api_request so they never use up max_retries.
+        retry = Retry(
+            total=config.max_retries,
+            backoff_factor=1.0,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=("GET",),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        self._session = requests.Session()
+        self._session_token: str | None = None  # Token currently in the Authorization header
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=config.max_workers,
+            pool_maxsize=max(config.max_workers * config.page_workers, 10),
+            max_retries=retry,
+        ))
         self._auth = TradeStationAuth(
             config.client_id,
             config.client_secret,
             config.refresh_token,
+            session=self._session,
         )
         self._storage = create_storage(
             config.storage_format,
             Path(config.data_dir),
             compression=config.compression.value,
             datetime_index=config.datetime_index,
+            compression_level=config.compression_level,
+            max_workers=config.write_workers,
         )
         self._stats = DownloadStats()
-        self._stats_lock = Lock()  # Thread-safe stats updates
 
     @property
     def stats(self) -> DownloadStats:
         return self._stats
 
+    def close(self) -> None:
+        """Close pooled HTTP connections."""
+        self._session.close()
+
     def download_all(
         self,
         symbols: list[str] | None = None,
@@ -100,12 +174,15 @@ class TradeStationDownloader:
 
         max_workers = self.config.max_workers
 
-        if max_workers <= 1:
-            # Sequential download (original behavior)
-            self._download_sequential(symbols, incremental)
-        else:
-            # Parallel download
-            self._download_parallel(symbols, incremental, max_workers)
+        try:
+            if max_workers <= 1:
+                # Sequential download (original behavior)
+                self._download_sequential(symbols, incremental)
+            else:
+                # Parallel download
+                self._download_parallel(symbols, incremental, max_workers)
+        finally:
+            self.close()
 
         self._stats.end_time = datetime.now()
         self._log_summary()
@@ -119,16 +196,11 @@ class TradeStationDownloader:
         """Download symbols sequentially."""
         for i, symbol in enumerate(symbols, 1):
             logger.info("[%d/%d] Processing %s...", i, len(symbols), symbol)
-            try:
-                self.download_symbol(symbol, incremental)
-            except Exception as e:
-                logger.error("Error processing %s: %s", symbol, e)
-                with self._stats_lock:
-                    self._stats.errors += 1
-                    self._stats.failed_symbols.append(symbol)
+            started = time.monotonic()
+            self._stats.merge(self._download_symbol_safe(symbol, incremental))
 
             if i < len(symbols):
-                time.sleep(0.2)
+                _sleep_remaining(started, 0.2)
 
     def _download_parallel(
         self,
@@ -141,24 +213,25 @@ class TradeStationDownloader:
 
         logger.info("Using %d parallel workers", max_workers)
 
-        def download_one(symbol: str) -> str:
-            try:
-                self.download_symbol(symbol, incremental)
-            except Exception as e:
-                logger.error("Error processing %s: %s", symbol, e)
-                with self._stats_lock:
-                    self._stats.errors += 1
-                    self._stats.failed_symbols.append(symbol)
-            return symbol
-
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {executor.submit(download_one, sym): sym for sym in symbols}
+            futures = {
+                executor.submit(self._download_symbol_safe, sym, incremental): sym for sym in symbols
+            }
             completed = 0
 
             for future in as_completed(futures):
                 completed += 1
-                symbol = future.result()
-                logger.info("[%d/%d] Completed %s", completed, total, symbol)
+                # Workers only return their stats; all merging happens on this thread
+                self._stats.merge(future.result())
+                logger.info("[%d/%d] Completed %s", completed, total, futures[future])
+
+    def _download_symbol_safe(self, symbol: str, incremental: bool) -> DownloadStats:
+        """Download one symbol, recording any error in the returned stats."""
+        try:
+            return self._download_symbol(symbol, incremental)
+        except Exception as e:
+            logger.error("Error processing %s: %s", symbol, e)
+            return DownloadStats(errors=1, failed_symbols=[symbol])
 
     def _get_download_start(self, symbol: str, incremental: bool) -> tuple[datetime, bool]:
         """
@@ -180,6 +253,11 @@ class TradeStationDownloader:
 
     def download_symbol(self, symbol: str, incremental: bool = True) -> None:
         """Download data for a single symbol."""
+        self._stats.merge(self._download_symbol(symbol, incremental))
+
+    def _download_symbol(self, symbol: str, incremental: bool) -> DownloadStats:
+        """Download data for a single symbol and return its stats (touches no shared state)."""
+        stats = DownloadStats()
         start_date, has_existing = self._get_download_start(symbol, incremental)
 
         logger.info("  [%s] Downloading from %s...", symbol, start_date.strftime("%Y-%m-%d %H:%M:%S"))
@@ -187,24 +265,22 @@ class TradeStationDownloader:
 
         if new_df.empty and not has_existing:
             logger.warning("  [%s] No data retrieved", symbol)
-            with self._stats_lock:
-                self._stats.errors += 1
-                self._stats.failed_symbols.append(symbol)
-            return
+            stats.errors += 1
+            stats.failed_symbols.append(symbol)
+            return stats
 
         if new_df.empty:
             logger.info("  [%s] Already up to date", symbol)
-            with self._stats_lock:
-                self._stats.symbols_processed += 1
-            return
+            stats.symbols_processed += 1
+            return stats
 
         # Use optimized append - only updates affected partitions for partitioned storage
         self._storage.append(symbol, new_df)
 
-        with self._stats_lock:
-            self._stats.symbols_processed += 1
-            self._stats.bars_downloaded += len(new_df)
+        stats.symbols_processed += 1
+        stats.bars_downloaded += len(new_df)
         logger.info("  [%s] Added %d bars", symbol, len(new_df))
+        return stats
 
     def _calc_barsback(self, start_date: datetime, end_date: datetime) -> int:
         """Calculate optimal bars to request based on time gap (1-min bars)."""
@@ -213,100 +289,178 @@ class TradeStationDownloader:
 
     def _fetch_bars(self, symbol: str, start_date: datetime) -> pd.DataFrame:
         """Fetch all bars for a symbol from start_date to now."""
-        all_bars = []
+        if self.config.page_workers > 1 and self.config.unit == "Minute":
+            return self._fetch_bars_concurrent(symbol, start_date)
+
+        columns: dict[str, list] = {key: [] for key in _COLUMN_MAP}  # Column-wise bar fields
         current_end = datetime.now(timezone.utc).replace(tzinfo=None)
+        # Bars stamped at or after the current minute may still be forming
+        cutoff = pd.Timestamp(current_end).floor("min")
         batch_num = 0
 
         while current_end > start_date:
             barsback = self._calc_barsback(start_date, current_end)
+            started = time.monotonic()
             data = self._api_request(symbol, current_end, barsback=barsback)
-            if not data or "Bars" not in data or not data["Bars"]:
+            if data is None:
+                # Stopping here would save a truncated history that updates never refill
+                raise RuntimeError(f"Failed to fetch bars before {current_end}")
+            if not data.get("Bars"):
                 break
 
             bars = data["Bars"]
-            all_bars.extend(bars)
+            _extend_columns(columns, bars)
             batch_num += 1
 
-            oldest = pd.to_datetime(bars[0]["TimeStamp"]).replace(tzinfo=None)
-            newest = pd.to_datetime(bars[-1]["TimeStamp"]).replace(tzinfo=None)
+            oldest, newest = _parse_timestamps([bars[0]["TimeStamp"], bars[-1]["TimeStamp"]])
             logger.info("  [%s] Batch %d: %d bars (%s to %s)", symbol, batch_num, len(bars), oldest.date(), newest.date())
 
             if oldest <= start_date:
                 break
 
             current_end = oldest - timedelta(minutes=1)
-            time.sleep(self.config.rate_limit_delay)
+            # The delay spaces out request starts; time spent on the request counts toward it
+            _sleep_remaining(started, self.config.rate_limit_delay)
+
+        return self._bars_to_dataframe(columns, start_date, cutoff, self.config.precision)
 
-        df = self._bars_to_dataframe(all_bars, start_date)
-        return df.iloc[:-1] if len(df) > 0 else df  # Drop last (incomplete) bar
+    def _fetch_bars_concurrent(self, symbol: str, start_date: datetime) -> pd.DataFrame:
+        """Fetch bars by requesting fixed date windows concurrently.
+
+        A window spans (max_bars_per_request - 1) bar intervals of wall-clock time, so it
+        can never hold more bars than one request returns, even for round-the-clock
+        markets; pages therefore need no knowledge of each other.
+        """
+        current_end = datetime.now(timezone.utc).replace(tzinfo=None)
+        cutoff = pd.Timestamp(current_end).floor("min")
+        span = timedelta(minutes=self.config.interval * (self.config.max_bars_per_request - 1))
+
+        windows = []
+        window_end = current_end
+        while window_end > start_date:
+            window_start = max(start_date, window_end - span)
+            windows.append((window_start, window_end))
+            window_end = window_start
+
+        def fetch(window: tuple[datetime, datetime]) -> dict[str, Any] | None:
+            started = time.monotonic()
+            data = self._api_request(symbol, window[1], first_date=window[0])
+            _sleep_remaining(started, self.config.rate_limit_delay)
+            return data
+
+        columns: dict[str, list] = {key: [] for key in _COLUMN_MAP}
+        with ThreadPoolExecutor(max_workers=self.config.page_workers) as executor:
+            results = executor.map(fetch, windows)
+            for (window_start, window_end), data in zip(windows, results, strict=True):
+                if data is None:
+                    # A missing window would leave a hole that incremental updates never refill
+                    raise RuntimeError(f"Failed to fetch bars from {window_start} to {window_end}")
+                bars = data.get("Bars") or []
+                _extend_columns(columns, bars)
+                logger.info(
+                    "  [%s] Window %s to %s: %d bars",
+                    symbol, window_start.date(), window_end.date(), len(bars),
+                )
+
+        # Adjacent windows share their boundary minute; _bars_to_dataframe drops the duplicate
+        return self._bars_to_dataframe(columns, start_date, cutoff, self.config.precision)
+
+    def _refresh_session_auth(self) -> None:
+        """Set the session's Authorization header from a valid access token."""
+        token = self._auth.get_access_token()
+        # Only rebuild the header when the auth handler has refreshed the token
+        if token is not self._session_token:
+            self._session.headers["Authorization"] = f"Bearer {token}"
+            self._session_token = token
 
     def _api_request(
         self,
         symbol: str,
         last_date: datetime,
         barsback: int | None = None,
-        retry: int = 0,
+        first_date: datetime | None = None,
     ) -> dict[str, Any] | None:
-        """Make API request with retry logic."""
+        """Make API request with retry logic (a first_date window replaces barsback)."""
         url = f"{self.BASE_URL}/marketdata/barcharts/{symbol}"
         params = {
             "interval": self.config.interval,
             "unit": self.config.unit,
-            "barsback": barsback or self.config.max_bars_per_request,
             "lastdate": last_date.strftime("%Y-%m-%dT%H:%M:%SZ"),
         }
-        headers = {
-            "Authorization": f"Bearer {self._auth.get_access_token()}",
-            "Content-Type": "application/json",
-        }
+        if first_date is not None:
+            params["firstdate"] = first_date.strftime("%Y-%m-%dT%H:%M:%SZ")
+        else:
+            params["barsback"] = barsback or self.config.max_bars_per_request
+        self._refresh_session_auth()
 
-        try:
-            resp = requests.get(url, headers=headers, params=params, timeout=60)
+        # Connection errors and 5xx are retried by the session's urllib3 adapter;
+        # this loop waits out rate limits and retries expired tokens and unparseable bodies
+        retry = 0
+        while True:
+            try:
+                resp = self._session.get(url, params=params, timeout=60)
+            except requests.exceptions.RequestException as e:
+                logger.error("Request failed after %d retries: %s", self.config.max_retries, e)
+                return None
 
             if resp.status_code == 429:
-                wait = int(resp.headers.get("Retry-After", 60))
+                # Expected during bulk downloads: wait as long as asked, without a retry limit
+                wait = _retry_after(resp)
                 logger.warning("Rate limited, waiting %ds...", wait)
                 time.sleep(wait)
-                return self._api_request(symbol, last_date, barsback, retry)
+                continue
 
-            if resp.status_code == 401:
+            if resp.status_code == 401 and retry < self.config.max_retries:
                 logger.info("Token expired, refreshing...")
                 self._auth.invalidate()
-                return self._api_request(symbol, last_date, barsback, retry)
-
-            resp.raise_for_status()
-            return resp.json()
+                self._refresh_session_auth()
+                retry += 1
+                continue
 
-        except requests.exceptions.RequestException as e:
-            if retry < self.config.max_retries:
+            try:
+                resp.raise_for_status()
+                return _json_loads(resp.content)
+            except requests.exceptions.HTTPError as e:
+                logger.error("Request failed: %s", e)
+                return None
+            except ValueError as e:  # Bad JSON
+                if retry >= self.config.max_retries:
+                    logger.error("Request failed after %d retries: %s", self.config.max_retries, e)
+                    return None
                 wait = 2 ** retry
-                logger.warning("Request failed: %s. Retrying in %ds...", e, wait)
+                logger.warning("Invalid response: %s. Retrying in %ds...", e, wait)
                 time.sleep(wait)
-                return self._api_request(symbol, last_date, barsback, retry + 1)
-            logger.error("Request failed after %d retries: %s", self.config.max_retries, e)
-            return None
+                retry += 1
 
     @staticmethod
-    def _bars_to_dataframe(bars: list[dict], start_date: datetime) -> pd.DataFrame:
-        """Convert API bars to DataFrame."""
-        if not bars:
+    def _bars_to_dataframe(
+        columns: dict[str, list],
+        start_date: datetime,
+        cutoff: datetime | None = None,
+        precision: Precision = Precision.FLOAT64,
+    ) -> pd.DataFrame:
+        """Convert column-wise API bar fields to DataFrame, keeping bars in [start_date, cutoff)."""
+        if not columns["TimeStamp"]:
             return pd.DataFrame(columns=_OUTPUT_COLUMNS)
 
-        df = pd.DataFrame(bars)
-        df["TimeStamp"] = pd.to_datetime(df["TimeStamp"])
-        if df["TimeStamp"].dt.tz is not None:
-            df["TimeStamp"] = df["TimeStamp"].dt.tz_convert(None)
-
-        df = df.rename(columns=_COLUMN_MAP)
-        df = df[[c for c in _OUTPUT_COLUMNS if c in df.columns]]
-
-        # Convert OHLCV to numeric types
-        for col in ["open", "high", "low", "close", "volume"]:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors="coerce")
-
-        df = df.sort_values("datetime").drop_duplicates(subset=["datetime"], keep="last")
-        df = df[df["datetime"] >= start_date]
+        data = {"datetime": _parse_timestamps(columns["TimeStamp"])}
+        # Convert OHLCV to numeric types (the API returns them as strings)
+        for key, values in columns.items():
+            if key != "TimeStamp":
+                data[_COLUMN_MAP[key]] = pd.to_numeric(values, errors="coerce")
+        # The arrays were just created here, so the frame can take them over without copying
+        df = pd.DataFrame(data, copy=False)
+        if precision is Precision.FLOAT32:
+            df[_PRICE_COLUMNS] = df[_PRICE_COLUMNS].astype("float32")
+            df["volume"] = df["volume"].fillna(0).astype("uint32")
+
+        # Pages arrive newest first; sort them and keep the last copy of any repeated bar
+        df = last_unique(df, df["datetime"].to_numpy())
+        keep = df["datetime"] >= start_date
+        if cutoff is not None:
+            keep &= df["datetime"] < cutoff
+        if not keep.all():
+            df = df[keep]
         return df.reset_index(drop=True)
 
     def _log_start(self, symbols: list[str], incremental: bool) -> None:
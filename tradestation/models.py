@@ -42,6 +42,47 @@ class Compression(Enum):
             raise ValueError(f"Invalid compression: '{value}'. Must be one of: {valid}")
 
 
+# Supported level range per codec; snappy and none take no level
+_COMPRESSION_LEVELS = {"zstd": (1, 22), "gzip": (1, 9), "lz4": (1, 12)}
+
+# zstd level used when none is configured (PyArrow's own default is 1)
+_DEFAULT_ZSTD_LEVEL = 3
+
+
+def resolve_compression_level(compression: str | None, level: int | None) -> int | None:
+    """Validate a compression level for a codec, applying the zstd default.
+
+    Returns None (codec default) for codecs without levels, such as snappy.
+    Raises ValueError for a level outside the codec's supported range.
+    """
+    if compression not in _COMPRESSION_LEVELS:
+        return None
+    if level is None:
+        return _DEFAULT_ZSTD_LEVEL if compression == "zstd" else None
+    low, high = _COMPRESSION_LEVELS[compression]
+    if not isinstance(level, int) or isinstance(level, bool) or not low <= level <= high:
+        raise ValueError(
+            f"Invalid compression level for {compression}: {level!r}. Must be between {low} and {high}"
+        )
+    return level
+
+
+class Precision(Enum):
+    """Numeric precision for stored OHLCV values."""
+
+    FLOAT64 = "float64"  # Exact API values (recommended)
+    FLOAT32 = "float32"  # Half the size; OHLC as float32 (~7 digits), volume as uint32
+
+    @classmethod
+    def from_string(cls, value: str) -> "Precision":
+        """Create Precision from string value."""
+        try:
+            return cls(value.lower())
+        except ValueError:
+            valid = ", ".join(f"'{p.value}'" for p in cls)
+            raise ValueError(f"Invalid precision: '{value}'. Must be one of: {valid}") from None
+
+
 @dataclass
 class DownloadConfig:
     """Configuration for the TradeStation data downloader."""
@@ -61,6 +102,10 @@ class DownloadConfig:
     storage_format: StorageFormat = StorageFormat.SINGLE
     compression: Compression = Compression.ZSTD
     datetime_index: bool = True  # Save with datetime as index (adds _index_1 suffix)
+    precision: Precision = Precision.FLOAT64
+    page_workers: int = 1  # Concurrent page requests per symbol, Minute bars only (1 = sequential)
+    compression_level: int | None = None  # Codec level (None = 3 for zstd, else codec default)
+    write_workers: int = 2  # Partition file writer threads per symbol (1 = sequential)
 
     def __post_init__(self):
         """Validate and convert fields after initialization."""
@@ -68,6 +113,8 @@ class DownloadConfig:
             self.storage_format = StorageFormat.from_string(self.storage_format)
         if isinstance(self.compression, str):
             self.compression = Compression.from_string(self.compression)
+        if isinstance(self.precision, str):
+            self.precision = Precision.from_string(self.precision)
 
 
 # Default US Futures symbols organized by category
@@ -3,62 +3,293 @@ Storage backends for market data persistence.
 """
 
 import logging
+import operator
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import reduce
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 
-from .models import StorageFormat
+from .models import StorageFormat, resolve_compression_level
 
 logger = logging.getLogger(__name__)
 
+# Rows per Parquet row group (also the batch size when streaming existing files).
+# Smaller groups than PyArrow's ~1M default give finer-grained min/max statistics.
+_ROW_GROUP_SIZE = 200_000
+
+
+def last_unique(df: pd.DataFrame, times: np.ndarray) -> pd.DataFrame:
+    """Sort rows by time, keeping the last row for each duplicate timestamp (one sort pass)."""
+    if len(times) < 2:
+        return df
+    # Stored and downloaded data is normally strictly increasing already: one O(n) check
+    # then skips the sort entirely
+    increasing = times[1:] > times[:-1]
+    if increasing.all():
+        return df
+    if (times[1:] >= times[:-1]).all():
+        # Sorted with repeated timestamps: keep the last row of each run, no sort or hashing
+        return df.iloc[np.append(increasing, True)]
+    # np.unique returns first occurrences in sorted order; on the reversed array those are the last
+    _, first_in_reversed = np.unique(times[::-1], return_index=True)
+    return df.iloc[len(times) - 1 - first_in_reversed]
+
+
+def _partition_runs(times: pd.Series, unit: str) -> list[tuple[datetime, int, int]]:
+    """Split sorted timestamps into contiguous calendar periods ("D" = day, "M" = month).
+
+    Returns (period start, first row, end row) for each period, found from the
+    boundaries where the truncated timestamp changes (no hashing or Python objects per row).
+    """
+    if times.empty:
+        return []
+    periods = times.to_numpy().astype(f"datetime64[{unit}]")
+    bounds = np.concatenate(([0], np.flatnonzero(periods[1:] != periods[:-1]) + 1, [len(periods)]))
+    starts = periods[bounds[:-1]].astype("datetime64[s]").tolist()
+    return list(zip(starts, bounds[:-1].tolist(), bounds[1:].tolist(), strict=True))
+
+
+def _partitioned_symbols(data_dir: Path, partition_prefix: str) -> list[str]:
+    """Symbols with a folder in data_dir holding at least one partition directory.
+
+    One scandir pass over data_dir, stopping each folder's scan at the first partition found.
+    """
+    symbols = []
+    with os.scandir(data_dir) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            try:
+                with os.scandir(entry.path) as children:
+                    if any(child.name.startswith(partition_prefix) for child in children):
+                        symbols.append(entry.name.removesuffix("_index_1"))
+            except OSError:  # e.g. an unreadable folder, which cannot hold our data
+                continue
+    return sorted(symbols)
+
+
+def _merge_frames(existing: pd.DataFrame, new: pd.DataFrame) -> pd.DataFrame:
+    """Merge two frames with a datetime column, preferring rows from new on overlap."""
+    existing_times = existing["datetime"].to_numpy()
+    new_times = new["datetime"].to_numpy()
+    if len(existing_times) and len(new_times) and (existing_times[1:] >= existing_times[:-1]).all():
+        # Existing data is stored sorted: rows before the first new bar are final as they are,
+        # so only the overlapping tail (usually empty or a few bars) needs sorting and deduping
+        cut = int(np.searchsorted(existing_times, new_times.min(), side="left"))
+        tail = pd.concat([existing.iloc[cut:], new], ignore_index=True)
+        tail = last_unique(tail, tail["datetime"].to_numpy())
+        return pd.concat([existing.iloc[:cut], tail], ignore_index=True)
+    merged = pd.concat([existing, new], ignore_index=True)
+    return last_unique(merged, merged["datetime"].to_numpy()).reset_index(drop=True)
+
 
 def _prepare_dataframe(df: pd.DataFrame, datetime_index: bool = True) -> pd.DataFrame:
-    """Prepare DataFrame for storage (ensure datetime, sort, dedupe, optionally set index)."""
-    df = df.copy()
+    """Prepare DataFrame for storage (ensure datetime, sort, dedupe, optionally set index).
 
+    The input is never mutated (steps return new frames), so it needs no defensive copy.
+    """
     # Handle case where datetime is already the index (loaded from parquet with datetime_index=True)
     if "datetime" not in df.columns and isinstance(df.index, pd.DatetimeIndex):
         if df.index.tz is not None:
-            df.index = df.index.tz_convert(None)
-        df = df.sort_index()
-        df = df[~df.index.duplicated(keep="last")]
+            df = df.set_axis(df.index.tz_convert(None))
+        df = last_unique(df, df.index.to_numpy())
         if not datetime_index:
             df = df.reset_index()
         return df
 
     # Normal case: datetime is a column
-    df["datetime"] = pd.to_datetime(df["datetime"])
-    if df["datetime"].dt.tz is not None:
-        df["datetime"] = df["datetime"].dt.tz_convert(None)
-    df = df.sort_values("datetime")
-    df = df.drop_duplicates(subset=["datetime"], keep="last")
+    # Parquet and the downloader already yield naive datetime64; only parse anything else
+    times = df["datetime"]
+    if not pd.api.types.is_datetime64_any_dtype(times):
+        df = df.assign(datetime=pd.to_datetime(times, format="ISO8601", utc=True).dt.tz_localize(None))
+    elif times.dt.tz is not None:
+        df = df.assign(datetime=times.dt.tz_convert(None))
+    df = last_unique(df, df["datetime"].to_numpy())
     df = df.set_index("datetime") if datetime_index else df.reset_index(drop=True)
     return df
 
 
+def _read_parquet(
+    path: Path,
+    columns: list[str] | None = None,
+    filters: ds.Expression | None = None,
+) -> pd.DataFrame:
+    """Read a Parquet file through PyArrow, optionally reading only the given columns/rows."""
+    table = pq.read_table(path, columns=columns, filters=filters, use_threads=True, pre_buffer=True)
+    return table.to_pandas(self_destruct=True, split_blocks=True)
+
+
+def _datetime_conditions(start: datetime | None, end: datetime | None) -> list[ds.Expression]:
+    """Build row filters for an inclusive datetime range."""
+    conditions = []
+    if start is not None:
+        conditions.append(ds.field("datetime") >= start)
+    if end is not None:
+        conditions.append(ds.field("datetime") <= end)
+    return conditions
+
+
+def _combine(conditions: list[ds.Expression]) -> ds.Expression | None:
+    """AND together filter expressions (None if there are none)."""
+    return reduce(operator.and_, conditions) if conditions else None
+
+
+def _load_partitions(
+    files: list[Path],
+    base_dir: Path,
+    partition_columns: tuple[str, ...],
+    conditions: list[ds.Expression],
+) -> pd.DataFrame:
+    """Read Hive-partitioned files as a single PyArrow dataset.
+
+    Conditions on partition columns prune whole files before they are opened;
+    conditions on data columns are pushed down to row group statistics.
+    """
+    dataset = ds.dataset(
+        [str(f) for f in files],
+        format="parquet",
+        partitioning="hive",
+        partition_base_dir=str(base_dir),
+    )
+    columns = [name for name in dataset.schema.names if name not in partition_columns]
+    table = dataset.to_table(columns=columns, filter=_combine(conditions), use_threads=True)
+    return table.to_pandas(self_destruct=True, split_blocks=True)
+
+
+def _write_parquet(
+    df: pd.DataFrame,
+    path: Path,
+    index: bool,
+    compression: str | None,
+    compression_level: int | None = None,
+) -> None:
+    """Write a DataFrame through PyArrow's Parquet writer, bypassing the pandas wrapper."""
+    table = pa.Table.from_pandas(df, preserve_index=index)
+    _write_table(table, path, compression, compression_level)
+
+
+def _write_table(
+    table: pa.Table,
+    path: Path,
+    compression: str | None,
+    compression_level: int | None = None,
+) -> None:
+    """Write an Arrow table to a Parquet file."""
+    # Statistics must stay enabled: get_last_timestamp reads them from the footer
+    pq.write_table(
+        table,
+        path,
+        compression=compression,
+        compression_level=compression_level,
+        row_group_size=_ROW_GROUP_SIZE,
+        write_statistics=True,
+    )
+
+
+def _latest_partition_file(symbol_dir: Path, levels: tuple[str, ...]) -> Path | None:
+    """Find the newest file of a Hive-partitioned symbol without listing every partition.
+
+    Partition values are fixed-width, so the greatest name at each level is the latest
+    period: this reads one directory per level instead of globbing the whole tree.
+    """
+    directory = str(symbol_dir)
+    for prefix in levels:
+        try:
+            with os.scandir(directory) as entries:
+                names = [e.name for e in entries if e.name.startswith(prefix) and e.is_dir()]
+        except FileNotFoundError:
+            return None
+        if not names:
+            return None
+        directory = os.path.join(directory, max(names))
+    with os.scandir(directory) as entries:
+        files = [e.name for e in entries if e.name.endswith(".parquet")]
+    return Path(directory, max(files)) if files else None
+
+
+def _read_last_timestamp(path: Path) -> datetime | None:
+    """Read the latest datetime in a Parquet file.
+
+    Uses the row group min/max statistics in the file footer, so no column data is
+    read. Falls back to reading the datetime column if statistics are missing.
+    """
+    pf = pq.ParquetFile(path)
+    metadata = pf.metadata
+    if metadata.num_rows == 0:
+        return None
+
+    column = pf.schema.names.index("datetime")
+    last = None
+    for i in range(metadata.num_row_groups):
+        stats = metadata.row_group(i).column(column).statistics
+        if stats is None or not stats.has_min_max:
+            last = None
+            break
+        if last is None or stats.max > last:
+            last = stats.max
+
+    if last is None:
+        # Aggregate in Arrow; no need to materialize the column in pandas
+        last = pc.max(pq.read_table(path, columns=["datetime"]).column("datetime")).as_py()
+
+    last = pd.Timestamp(last)
+    if last.tz is not None:
+        last = last.tz_convert(None)
+    return last.to_pydatetime()
+
+
 class StorageBackend(ABC):
     """Abstract base class for data storage backends."""
 
-    def __init__(self, data_dir: Path, compression: str = "zstd", datetime_index: bool = True):
+    def __init__(
+        self,
+        data_dir: Path,
+        compression: str = "zstd",
+        datetime_index: bool = True,
+        max_workers: int | None = None,
+        compression_level: int | None = None,
+    ):
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
-        # Convert "none" to None for pandas (no compression)
+        # Convert "none" to None for PyArrow (no compression)
         self.compression = None if compression == "none" else compression
+        # None = 3 for zstd, otherwise the codec default; ignored by codecs without levels
+        self.compression_level = resolve_compression_level(self.compression, compression_level)
         self.datetime_index = datetime_index
+        # Threads used to write partition files (None = executor default, 1 = sequential)
+        self.max_workers = max_workers
+        # Symbol -> folder name (looked up once per partition path)
+        self._folder_cache: dict[str, str] = {}
 
     def _get_symbol_folder(self, symbol: str) -> str:
         """Get folder name with optional _index_1 suffix."""
-        return f"{symbol}_index_1" if self.datetime_index else symbol
+        folder = self._folder_cache.get(symbol)
+        if folder is None:
+            folder = f"{symbol}_index_1" if self.datetime_index else symbol
+            self._folder_cache[symbol] = folder
+        return folder
 
     @abstractmethod
     def save(self, symbol: str, df: pd.DataFrame) -> None:
         """Save data for a symbol."""
 
     @abstractmethod
-    def load(self, symbol: str) -> pd.DataFrame | None:
-        """Load all data for a symbol."""
+    def load(
+        self,
+        symbol: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> pd.DataFrame | None:
+        """Load data for a symbol, optionally limited to an inclusive datetime range."""
 
     @abstractmethod
     def list_symbols(self) -> list[str]:
@@ -68,6 +299,32 @@ class StorageBackend(ABC):
     def get_file_size(self, symbol: str) -> int:
         """Get total file size in bytes for a symbol."""
 
+    def _to_table(self, df: pd.DataFrame) -> pa.Table:
+        """Convert a DataFrame with a datetime column to an Arrow table in the stored layout."""
+        if self.datetime_index:
+            df = df.set_index("datetime")
+        return pa.Table.from_pandas(df, preserve_index=self.datetime_index)
+
+    def _write_partitions(self, partitions: list[tuple[Path, pa.Table]]) -> None:
+        """Write partition files concurrently (PyArrow releases the GIL while encoding)."""
+
+        # Create each partition directory once, up front, rather than from every writer thread
+        for directory in {filepath.parent for filepath, _ in partitions}:
+            directory.mkdir(parents=True, exist_ok=True)
+
+        def write(partition: tuple[Path, pa.Table]) -> None:
+            filepath, table = partition
+            _write_table(table, filepath, self.compression, self.compression_level)
+
+        if self.max_workers == 1 or len(partitions) <= 1:
+            for partition in partitions:
+                write(partition)
+            return
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # Consume results so write errors propagate to the caller
+            list(executor.map(write, partitions))
+
     def get_last_timestamp(self, symbol: str) -> datetime | None:
         """Get the last timestamp for a symbol without loading all data.
 
@@ -99,9 +356,7 @@ class StorageBackend(ABC):
         if "datetime" not in new_df.columns and isinstance(new_df.index, pd.DatetimeIndex):
             new_df = new_df.reset_index(names=["datetime"])
 
-        merged = pd.concat([existing_df, new_df], ignore_index=True)
-        merged = merged.drop_duplicates(subset=["datetime"], keep="last").sort_values("datetime")
-        self.save(symbol, merged)
+        self.save(symbol, _merge_frames(existing_df, new_df))
 
 
 class SingleFileStorage(StorageBackend):
@@ -113,26 +368,116 @@ class SingleFileStorage(StorageBackend):
 
     def save(self, symbol: str, df: pd.DataFrame) -> None:
         df = _prepare_dataframe(df, self.datetime_index)
-        df.to_parquet(self._get_filepath(symbol), index=self.datetime_index, compression=self.compression)
+        _write_parquet(
+            df, self._get_filepath(symbol), self.datetime_index, self.compression, self.compression_level
+        )
 
-    def load(self, symbol: str) -> pd.DataFrame | None:
+    def load(
+        self,
+        symbol: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> pd.DataFrame | None:
         filepath = self._get_filepath(symbol)
         if not filepath.exists():
             return None
         try:
-            return _prepare_dataframe(pd.read_parquet(filepath), self.datetime_index)
+            df = _read_parquet(filepath, filters=_combine(_datetime_conditions(start, end)))
+            return _prepare_dataframe(df, self.datetime_index)
         except Exception as e:
             logger.warning("Failed to load %s: %s", filepath, e)
             return None
 
     def list_symbols(self) -> list[str]:
-        files = self.data_dir.glob("*_1min.parquet")
-        return sorted(f.stem.replace("_index_1_1min", "").replace("_1min", "") for f in files)
+        with os.scandir(self.data_dir) as entries:
+            names = [
+                e.name
+                for e in entries
+                if e.name.endswith("_1min.parquet") and not e.name.startswith(".") and e.is_file()
+            ]
+        return sorted(
+            name.removesuffix(".parquet").replace("_index_1_1min", "").replace("_1min", "")
+            for name in names
+        )
 
     def get_file_size(self, symbol: str) -> int:
         filepath = self._get_filepath(symbol)
         return filepath.stat().st_size if filepath.exists() else 0
 
+    def get_last_timestamp(self, symbol: str) -> datetime | None:
+        """Get last timestamp from the file footer statistics."""
+        filepath = self._get_filepath(symbol)
+        if not filepath.exists():
+            return None
+        try:
+            return _read_last_timestamp(filepath)
+        except Exception as e:
+            logger.warning("Failed to get last timestamp for %s: %s", symbol, e)
+            return None
+
+    def append(self, symbol: str, new_df: pd.DataFrame) -> None:
+        """Append new data by streaming the existing file batch by batch.
+
+        Rows older than the new data are copied to the output unchanged, so only the
+        overlapping tail is loaded into pandas. Falls back to a full load/merge/save if
+        the existing file cannot be streamed (e.g. it is not sorted).
+        """
+        filepath = self._get_filepath(symbol)
+        if not filepath.exists():
+            self.save(symbol, new_df)
+            return
+
+        new_df = _prepare_dataframe(new_df, datetime_index=False)
+        if new_df.empty:
+            return
+
+        tmp_path = filepath.with_name(filepath.name + ".tmp")
+        try:
+            self._stream_append(filepath, tmp_path, new_df)
+            tmp_path.replace(filepath)
+        except Exception as e:
+            tmp_path.unlink(missing_ok=True)
+            logger.debug("Streaming append failed for %s (%s), rewriting file", symbol, e)
+            super().append(symbol, new_df)
+
+    def _stream_append(self, filepath: Path, tmp_path: Path, new_df: pd.DataFrame) -> None:
+        """Write existing rows before new_df's first timestamp, then the merged tail."""
+        cutoff = new_df["datetime"].iloc[0]
+        pf = pq.ParquetFile(filepath)
+        schema = pf.schema_arrow
+        tail = []
+        previous = None
+
+        with pq.ParquetWriter(
+            tmp_path,
+            schema,
+            compression=self.compression,
+            compression_level=self.compression_level,
+            write_statistics=True,
+        ) as writer:
+            for batch in pf.iter_batches(batch_size=_ROW_GROUP_SIZE):
+                times = batch.column("datetime").to_pandas()
+                if not times.is_monotonic_increasing or (previous is not None and times.iloc[0] < previous):
+                    raise ValueError("existing data is not sorted by datetime")
+                previous = times.iloc[-1]
+
+                split = int(times.searchsorted(cutoff))
+                if split > 0:
+                    writer.write_batch(batch.slice(0, split))
+                if split < batch.num_rows:
+                    tail.append(batch.slice(split))
+
+            merged = new_df
+            if tail:
+                existing = pa.Table.from_batches(tail, schema=schema).to_pandas()
+                if "datetime" not in existing.columns:
+                    existing = existing.reset_index(names=["datetime"])
+                merged = pd.concat([existing, new_df], ignore_index=True)
+
+            merged = _prepare_dataframe(merged, self.datetime_index)
+            table = pa.Table.from_pandas(merged, schema=schema, preserve_index=self.datetime_index)
+            writer.write_table(table, row_group_size=_ROW_GROUP_SIZE)
+
 
 class DailyPartitionedStorage(StorageBackend):
     """Store data partitioned by day (Hive-style: symbol/year=YYYY/month=MM/day=DD/)."""
@@ -142,13 +487,9 @@ class DailyPartitionedStorage(StorageBackend):
 
     def _get_partition_path(self, symbol: str, dt: datetime) -> Path:
         folder = self._get_symbol_folder(symbol)
-        return (
-            self._get_symbol_dir(symbol)
-            / f"year={dt.year}"
-            / f"month={dt.month:02d}"
-            / f"day={dt.day:02d}"
-            / f"{folder}.parquet"
-        )
+        # One join for the whole relative path (called once per day on large saves)
+        day = f"year={dt.year}/month={dt.month:02d}/day={dt.day:02d}"
+        return self.data_dir / f"{folder}/{day}/{folder}.parquet"
 
     def _get_partition_files(self, symbol: str) -> list[Path]:
         symbol_dir = self._get_symbol_dir(symbol)
@@ -157,49 +498,56 @@ class DailyPartitionedStorage(StorageBackend):
         return sorted(symbol_dir.glob("year=*/month=*/day=*/*.parquet"))
 
     def save(self, symbol: str, df: pd.DataFrame) -> None:
-        df = _prepare_dataframe(df, datetime_index=False)  # Keep datetime as column for groupby
-        for date, group in df.groupby(df["datetime"].dt.date):
-            filepath = self._get_partition_path(symbol, datetime.combine(date, datetime.min.time()))
-            filepath.parent.mkdir(parents=True, exist_ok=True)
-            if self.datetime_index:
-                group = group.set_index("datetime")
-            group.to_parquet(filepath, index=self.datetime_index, compression=self.compression)
-
-    def load(self, symbol: str) -> pd.DataFrame | None:
+        df = _prepare_dataframe(df, datetime_index=False)  # Keep datetime as column for partitioning
+        # Convert once and write zero-copy slices; rows are sorted, so each day is contiguous
+        table = self._to_table(df)
+        self._write_partitions([
+            (self._get_partition_path(symbol, day), table.slice(start, stop - start))
+            for day, start, stop in _partition_runs(df["datetime"], "D")
+        ])
+
+    def load(
+        self,
+        symbol: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> pd.DataFrame | None:
         files = self._get_partition_files(symbol)
         if not files:
             return None
         try:
-            df = pd.concat([pd.read_parquet(f) for f in files], ignore_index=not self.datetime_index)
+            conditions = _datetime_conditions(start, end)
+            day = ds.field("year") * 10000 + ds.field("month") * 100 + ds.field("day")
+            if start is not None:
+                conditions.append(day >= start.year * 10000 + start.month * 100 + start.day)
+            if end is not None:
+                conditions.append(day <= end.year * 10000 + end.month * 100 + end.day)
+            df = _load_partitions(
+                files, self._get_symbol_dir(symbol), ("year", "month", "day"), conditions
+            )
             return _prepare_dataframe(df, self.datetime_index)
         except Exception as e:
             logger.warning("Failed to load partitions for %s: %s", symbol, e)
             return None
 
     def list_symbols(self) -> list[str]:
-        symbols = []
-        for item in self.data_dir.iterdir():
-            if item.is_dir() and list(item.glob("year=*")):
-                name = item.name.replace("_index_1", "") if item.name.endswith("_index_1") else item.name
-                symbols.append(name)
-        return sorted(symbols)
+        return _partitioned_symbols(self.data_dir, "year=")
 
     def get_file_size(self, symbol: str) -> int:
         return sum(f.stat().st_size for f in self._get_partition_files(symbol))
 
     def get_last_timestamp(self, symbol: str) -> datetime | None:
-        """Get last timestamp by reading only the latest partition."""
-        files = self._get_partition_files(symbol)
-        if not files:
-            return None
-        try:
+        """Get last timestamp from the footer statistics of the latest partition."""
+        latest = _latest_partition_file(self._get_symbol_dir(symbol), ("year=", "month=", "day="))
+        if latest is None:
+            # e.g. an empty latest partition directory: fall back to listing every file
+            files = self._get_partition_files(symbol)
+            if not files:
+                return None
             # Files are sorted, so last file is the latest partition
-            df = pd.read_parquet(files[-1])
-            if isinstance(df.index, pd.DatetimeIndex):
-                return df.index.max().to_pydatetime()
-            if "datetime" in df.columns:
-                return pd.to_datetime(df["datetime"]).max().to_pydatetime()
-            return None
+            latest = files[-1]
+        try:
+            return _read_last_timestamp(latest)
         except Exception as e:
             logger.warning("Failed to get last timestamp for %s: %s", symbol, e)
             return None
@@ -210,25 +558,24 @@ class DailyPartitionedStorage(StorageBackend):
         if new_df.empty:
             return
 
-        for date, group in new_df.groupby(new_df["datetime"].dt.date):
-            filepath = self._get_partition_path(symbol, datetime.combine(date, datetime.min.time()))
+        partitions = []
+        for day, start, stop in _partition_runs(new_df["datetime"], "D"):
+            filepath = self._get_partition_path(symbol, day)
+            group = new_df.iloc[start:stop]
 
             # If partition exists, merge with existing data
             if filepath.exists():
                 try:
-                    existing = pd.read_parquet(filepath)
+                    existing = _read_parquet(filepath)
                     if isinstance(existing.index, pd.DatetimeIndex):
                         existing = existing.reset_index(names=["datetime"])
-                    merged = pd.concat([existing, group], ignore_index=True)
-                    merged = merged.drop_duplicates(subset=["datetime"], keep="last").sort_values("datetime")
-                    group = merged
+                    group = _merge_frames(existing, group)
                 except Exception as e:
                     logger.warning("Failed to merge partition %s: %s", filepath, e)
 
-            filepath.parent.mkdir(parents=True, exist_ok=True)
-            if self.datetime_index:
-                group = group.set_index("datetime")
-            group.to_parquet(filepath, index=self.datetime_index, compression=self.compression)
+            partitions.append((filepath, self._to_table(group)))
+
+        self._write_partitions(partitions)
 
 
 class MonthlyPartitionedStorage(StorageBackend):
@@ -238,12 +585,8 @@ class MonthlyPartitionedStorage(StorageBackend):
         return self.data_dir / self._get_symbol_folder(symbol)
 
     def _get_partition_path(self, symbol: str, dt: datetime) -> Path:
-        year_month = dt.strftime("%Y-%m")
-        return (
-            self._get_symbol_dir(symbol)
-            / f"year_month={year_month}"
-            / "data-0.parquet"
-        )
+        folder = self._get_symbol_folder(symbol)
+        return self.data_dir / f"{folder}/year_month={dt.year}-{dt.month:02d}/data-0.parquet"
 
     def _get_partition_files(self, symbol: str) -> list[Path]:
         symbol_dir = self._get_symbol_dir(symbol)
@@ -252,49 +595,53 @@ class MonthlyPartitionedStorage(StorageBackend):
         return sorted(symbol_dir.glob("year_month=*/*.parquet"))
 
     def save(self, symbol: str, df: pd.DataFrame) -> None:
-        df = _prepare_dataframe(df, datetime_index=False)  # Keep datetime as column for groupby
-        for period, group in df.groupby(df["datetime"].dt.to_period("M")):
-            filepath = self._get_partition_path(symbol, period.to_timestamp())
-            filepath.parent.mkdir(parents=True, exist_ok=True)
-            if self.datetime_index:
-                group = group.set_index("datetime")
-            group.to_parquet(filepath, index=self.datetime_index, compression=self.compression)
-
-    def load(self, symbol: str) -> pd.DataFrame | None:
+        df = _prepare_dataframe(df, datetime_index=False)  # Keep datetime as column for partitioning
+        # Convert once and write zero-copy slices; rows are sorted, so each month is contiguous
+        table = self._to_table(df)
+        self._write_partitions([
+            (self._get_partition_path(symbol, month), table.slice(start, stop - start))
+            for month, start, stop in _partition_runs(df["datetime"], "M")
+        ])
+
+    def load(
+        self,
+        symbol: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> pd.DataFrame | None:
         files = self._get_partition_files(symbol)
         if not files:
             return None
         try:
-            df = pd.concat([pd.read_parquet(f) for f in files], ignore_index=not self.datetime_index)
+            conditions = _datetime_conditions(start, end)
+            if start is not None:
+                conditions.append(ds.field("year_month") >= start.strftime("%Y-%m"))
+            if end is not None:
+                conditions.append(ds.field("year_month") <= end.strftime("%Y-%m"))
+            df = _load_partitions(files, self._get_symbol_dir(symbol), ("year_month",), conditions)
             return _prepare_dataframe(df, self.datetime_index)
         except Exception as e:
             logger.warning("Failed to load partitions for %s: %s", symbol, e)
             return None
 
     def list_symbols(self) -> list[str]:
-        symbols = []
-        for item in self.data_dir.iterdir():
-            if item.is_dir() and list(item.glob("year_month=*")):
-                name = item.name.replace("_index_1", "") if item.name.endswith("_index_1") else item.name
-                symbols.append(name)
-        return sorted(symbols)
+        return _partitioned_symbols(self.data_dir, "year_month=")
 
     def get_file_size(self, symbol: str) -> int:
         return sum(f.stat().st_size for f in self._get_partition_files(symbol))
 
     def get_last_timestamp(self, symbol: str) -> datetime | None:
-        """Get last timestamp by reading only the latest partition."""
-        files = self._get_partition_files(symbol)
-        if not files:
-            return None
-        try:
+        """Get last timestamp from the footer statistics of the latest partition."""
+        latest = _latest_partition_file(self._get_symbol_dir(symbol), ("year_month=",))
+        if latest is None:
+            # e.g. an empty latest partition directory: fall back to listing every file
+            files = self._get_partition_files(symbol)
+            if not files:
+                return None
             # Files are sorted, so last file is the latest partition
-            df = pd.read_parquet(files[-1])
-            if isinstance(df.index, pd.DatetimeIndex):
-                return df.index.max().to_pydatetime()
-            if "datetime" in df.columns:
-                return pd.to_datetime(df["datetime"]).max().to_pydatetime()
-            return None
+            latest = files[-1]
+        try:
+            return _read_last_timestamp(latest)
         except Exception as e:
             logger.warning("Failed to get last timestamp for %s: %s", symbol, e)
             return None
@@ -305,25 +652,24 @@ class MonthlyPartitionedStorage(StorageBackend):
         if new_df.empty:
             return
 
-        for period, group in new_df.groupby(new_df["datetime"].dt.to_period("M")):
-            filepath = self._get_partition_path(symbol, period.to_timestamp())
+        partitions = []
+        for month, start, stop in _partition_runs(new_df["datetime"], "M"):
+            filepath = self._get_partition_path(symbol, month)
+            group = new_df.iloc[start:stop]
 
             # If partition exists, merge with existing data
             if filepath.exists():
                 try:
-                    existing = pd.read_parquet(filepath)
+                    existing = _read_parquet(filepath)
                     if isinstance(existing.index, pd.DatetimeIndex):
                         existing = existing.reset_index(names=["datetime"])
-                    merged = pd.concat([existing, group], ignore_index=True)
-                    merged = merged.drop_duplicates(subset=["datetime"], keep="last").sort_values("datetime")
-                    group = merged
+                    group = _merge_frames(existing, group)
                 except Exception as e:
                     logger.warning("Failed to merge partition %s: %s", filepath, e)
 
-            filepath.parent.mkdir(parents=True, exist_ok=True)
-            if self.datetime_index:
-                group = group.set_index("datetime")
-            group.to_parquet(filepath, index=self.datetime_index, compression=self.compression)
+            partitions.append((filepath, self._to_table(group)))
+
+        self._write_partitions(partitions)
 
 
 _BACKENDS = {
@@ -337,10 +683,18 @@ def create_storage(
     storage_format: StorageFormat,
     data_dir: Path,
     compression: str = "zstd",
-    datetime_index: bool = True
+    datetime_index: bool = True,
+    max_workers: int | None = None,
+    compression_level: int | None = None,
 ) -> StorageBackend:
     """Create the appropriate storage backend."""
-    return _BACKENDS[storage_format](data_dir, compression=compression, datetime_index=datetime_index)
+    return _BACKENDS[storage_format](
+        data_dir,
+        compression=compression,
+        datetime_index=datetime_index,
+        max_workers=max_workers,
+        compression_level=compression_level,
+    )
 
 
 def detect_storage_format(data_dir: Path) -> StorageFormat:
@@ -349,15 +703,16 @@ def detect_storage_format(data_dir: Path) -> StorageFormat:
     if not data_dir.exists():
         return StorageFormat.SINGLE
 
+    # any() stops each glob at its first match instead of listing every partition
     for item in data_dir.iterdir():
         if item.is_dir() and not item.name.endswith(".parquet"):
-            if list(item.glob("year=*/month=*/day=*")):
+            if any(item.glob("year=*/month=*/day=*")):
                 return StorageFormat.DAILY
             # Check for new year_month=YYYY-MM format first
-            if list(item.glob("year_month=*")):
+            if any(item.glob("year_month=*")):
                 return StorageFormat.MONTHLY
             # Also check legacy year=/month= format
-            if list(item.glob("year=*/month=*")):
+            if any(item.glob("year=*/month=*")):
                 return StorageFormat.MONTHLY
 
     return StorageFormat.SINGLE